@@ -0,0 +1,118 @@
+"""
+Shared subprocess plumbing for the one-shot TypeScript CLIs.
+
+Drains stdout and stderr together with a selectors loop on the op thread,
+instead of parking a dedicated stderr-pump thread per op. stderr lines are
+forwarded to Dagster as they arrive; stdout (the CLI's JSON result) is
+accumulated and returned as bytes.
+"""
+
+import selectors
+import subprocess
+import time
+
+from dagster import OpExecutionContext
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX
+    fcntl = None
+
+# Linux-only fcntl; absent from the module on older Pythons
+_F_SETPIPE_SZ = getattr(fcntl, "F_SETPIPE_SZ", 1031) if fcntl else None
+_PIPE_SIZE = 1 << 20  # 1 MiB
+
+# Reads land in one preallocated buffer instead of a fresh bytes object
+# per os.read; the loop only copies out the filled slice.
+_READ_BUF_SIZE = 65536
+
+
+def _widen_pipe(fileobj):
+    """Grow the kernel pipe buffer (default 64 KiB) so a bursty child
+    blocks less often between our reads. Best-effort: silently skipped
+    where unsupported or capped by /proc/sys/fs/pipe-max-size."""
+    if fcntl is None:
+        return
+    try:
+        fcntl.fcntl(fileobj.fileno(), _F_SETPIPE_SZ, _PIPE_SIZE)
+    except OSError:
+        pass
+
+
+def run_cli(context: OpExecutionContext, args: list, timeout: float, name: str) -> bytes:
+    """Run a one-shot TS CLI, streaming its stderr logs to Dagster in real-time.
+
+    Returns the captured stdout bytes. Raises on non-zero exit or timeout.
+    """
+
+    # env is inherited from this process; passing env={**os.environ}
+    # would just rebuild the same mapping for every spawn
+    proc = subprocess.Popen(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    _widen_pipe(proc.stdout)
+    _widen_pipe(proc.stderr)
+
+    stdout_chunks = []
+    stderr_buf = bytearray()
+    error_lines = []
+    read_view = memoryview(bytearray(_READ_BUF_SIZE))
+    deadline = time.monotonic() + timeout
+
+    def handle_stderr_line(raw_line: bytes):
+        line = raw_line.decode("utf-8", "replace").strip()
+        if line:
+            context.log.info(f"[TS] {line}")
+            if "[ERROR]" in line:
+                error_lines.append(line)
+
+    sel = selectors.DefaultSelector()
+    sel.register(proc.stdout, selectors.EVENT_READ, "stdout")
+    sel.register(proc.stderr, selectors.EVENT_READ, "stderr")
+
+    open_streams = 2
+    try:
+        while open_streams:
+            if time.monotonic() > deadline:
+                proc.kill()
+                proc.wait()
+                raise Exception(f"{name} timed out after {int(timeout // 60)} minutes")
+
+            for key, _ in sel.select(timeout=1.0):
+                # Raw read: returns whatever is available, into the shared buffer
+                n = key.fileobj.raw.readinto(read_view)
+                if not n:
+                    sel.unregister(key.fileobj)
+                    open_streams -= 1
+                    continue
+
+                if key.data == "stdout":
+                    stdout_chunks.append(bytes(read_view[:n]))
+                else:
+                    stderr_buf += read_view[:n]
+                    while True:
+                        newline = stderr_buf.find(b"\n")
+                        if newline < 0:
+                            break
+                        handle_stderr_line(stderr_buf[:newline])
+                        del stderr_buf[: newline + 1]
+    finally:
+        sel.close()
+
+    if stderr_buf:
+        handle_stderr_line(stderr_buf)
+
+    # Both pipes hit EOF, so the process is exiting (or already gone)
+    try:
+        returncode = proc.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        returncode = proc.wait()
+
+    if returncode != 0:
+        error_detail = error_lines[-1] if error_lines else "See logs above for details"
+        raise Exception(f"{name} failed (exit code {returncode}): {error_detail}")
+
+    return b"".join(stdout_chunks)
@@ -1,18 +1,20 @@
 """
 Fargate Operations - Thin Python wrapper that delegates to TypeScript.
-The actual ECS task launching and CloudWatch log streaming lives in dagster_ts/src/fargate-cli.ts
+The actual ECS task launching and CloudWatch log streaming lives in
+dagster_ts/src/fargate-ops.ts, served by the persistent op-worker.ts
+(with the one-shot fargate-cli.ts as fallback).
 """
 
-import json
 import os
-import subprocess
-import threading
 
 from dagster import Config, OpExecutionContext, Out, op
 
-# Path to the compiled TypeScript fargate CLI
-FARGATE_CLI = os.path.join(
-    os.path.dirname(__file__), "..", "..", "dagster_ts", "dist", "fargate-cli.js"
+from . import cli_process, fast_json, ts_worker
+
+# Path to the compiled TypeScript fargate CLI (fallback when the
+# persistent op worker is unavailable; canonicalized once at import)
+FARGATE_CLI = os.path.realpath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "dagster_ts", "dist", "fargate-cli.js")
 )
 
 
@@ -22,16 +24,7 @@ class ProcessFileConfig(Config):
     s3_bucket: str
     s3_key: str
     task_size: str | None = None  # auto-detect if None
-
-
-def _stream_stderr(proc, context: OpExecutionContext, error_lines: list):
-    """Stream stderr from the TS process to Dagster logs in real-time."""
-    for line in iter(proc.stderr.readline, ""):
-        line = line.strip()
-        if line:
-            context.log.info(f"[TS] {line}")
-            if "[ERROR]" in line:
-                error_lines.append(line)
+    s3_etag: str | None = None  # enables cached file-size lookups when known
 
 
 @op(
@@ -43,8 +36,10 @@ def process_file_with_pipes(
     config: ProcessFileConfig,
 ) -> dict:
     """
-    Process a file using ECS Fargate via the TypeScript fargate-cli.
-    The TS process launches the task, streams CloudWatch logs, and returns the result.
+    Process a file using ECS Fargate via the TypeScript orchestrator.
+    Uses the persistent op worker when available (no per-run `node` startup
+    cost); falls back to spawning the one-shot fargate-cli otherwise.
+    The TS side launches the task, streams CloudWatch logs, and returns the result.
     """
 
     context.log.info("=" * 50)
@@ -52,45 +47,43 @@ def process_file_with_pipes(
     context.log.info("=" * 50)
     context.log.info(f"File: s3://{config.s3_bucket}/{config.s3_key}")
 
+    try:
+        result = ts_worker.call_op(
+            context,
+            "fargate",
+            {
+                "s3Bucket": config.s3_bucket,
+                "s3Key": config.s3_key,
+                "taskSize": config.task_size,
+                "runId": context.run_id,
+                "s3Etag": config.s3_etag,
+            },
+            timeout=900,
+        )
+    except ts_worker.WorkerUnavailable as e:
+        context.log.warning(f"TS worker unavailable ({e}), falling back to one-shot fargate-cli")
+        result = _run_fargate_cli(context, config)
+
+    context.log.info("=" * 50)
+    context.log.info(f"Result: {result['status']}")
+    context.log.info("=" * 50)
+
+    return result
+
+
+def _run_fargate_cli(context: OpExecutionContext, config: ProcessFileConfig) -> dict:
+    """Fallback path: spawn the one-shot fargate-cli subprocess."""
+
     args = ["node", FARGATE_CLI, config.s3_bucket, config.s3_key]
     if config.task_size:
         args.append(config.task_size)
     else:
         args.append("")
     args.append(context.run_id)
+    args.append(config.s3_etag or "")
 
-    proc = subprocess.Popen(
-        args,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        env={**os.environ},
-    )
-
-    # Stream stderr (logs) in a separate thread for real-time output
-    error_lines = []
-    log_thread = threading.Thread(target=_stream_stderr, args=(proc, context, error_lines))
-    log_thread.daemon = True
-    log_thread.start()
-
-    # Wait for process to finish (max 15 min)
-    try:
-        stdout, _ = proc.communicate(timeout=900)
-    except subprocess.TimeoutExpired:
-        proc.kill()
-        raise Exception("fargate-cli timed out after 15 minutes")
-
-    log_thread.join(timeout=5)
-
-    if proc.returncode != 0:
-        error_detail = error_lines[-1] if error_lines else "See logs above for details"
-        raise Exception(f"fargate-cli failed (exit code {proc.returncode}): {error_detail}")
-
-    # Parse result JSON from stdout
-    result = json.loads(stdout.strip())
+    # Drain stdout/stderr on the op thread (max 15 min)
+    stdout = cli_process.run_cli(context, args, timeout=900, name="fargate-cli")
 
-    context.log.info("=" * 50)
-    context.log.info(f"Result: {result['status']}")
-    context.log.info("=" * 50)
-
-    return result
+    # Parse result JSON from stdout (bytes, whitespace tolerated)
+    return fast_json.loads(stdout)
@@ -0,0 +1,24 @@
+"""
+JSON parsing for the TS-bridge hot paths.
+
+Uses orjson when installed (several times faster than the stdlib on the
+CLI/worker payloads), falling back to the stdlib json module so a missing
+optional dependency never breaks the pipeline. Both accept str, bytes, or
+a memoryview (e.g. over an mmap of a shared-memory payload).
+"""
+
+try:
+    import orjson
+
+    def loads(data):
+        """Parse JSON from str, bytes, or a memoryview."""
+        return orjson.loads(data)
+
+except ImportError:
+    import json
+
+    def loads(data):
+        """Parse JSON from str, bytes, or a memoryview."""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
@@ -1,18 +1,20 @@
 """
 Lambda Operations - Thin Python wrapper that delegates to TypeScript.
-The actual Lambda invocation and CloudWatch log streaming lives in dagster_ts/src/lambda-cli.ts
+The actual Lambda invocation and CloudWatch log streaming lives in
+dagster_ts/src/lambda-ops.ts, served by the persistent op-worker.ts
+(with the one-shot lambda-cli.ts as fallback).
 """
 
-import json
 import os
-import subprocess
-import threading
 
 from dagster import Config, OpExecutionContext, Out, op
 
-# Path to the compiled TypeScript lambda CLI
-LAMBDA_CLI = os.path.join(
-    os.path.dirname(__file__), "..", "..", "dagster_ts", "dist", "lambda-cli.js"
+from . import cli_process, fast_json, ts_worker
+
+# Path to the compiled TypeScript lambda CLI (fallback when the
+# persistent op worker is unavailable; canonicalized once at import)
+LAMBDA_CLI = os.path.realpath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "dagster_ts", "dist", "lambda-cli.js")
 )
 
 
@@ -23,16 +25,6 @@ class LambdaProcessFileConfig(Config):
     s3_key: str
 
 
-def _stream_stderr(proc, context: OpExecutionContext, error_lines: list):
-    """Stream stderr from the TS process to Dagster logs in real-time."""
-    for line in iter(proc.stderr.readline, ""):
-        line = line.strip()
-        if line:
-            context.log.info(f"[TS] {line}")
-            if "[ERROR]" in line:
-                error_lines.append(line)
-
-
 @op(
     out={"result": Out(dict)},
     tags={"kind": "lambda"},
@@ -42,8 +34,10 @@ def process_file_with_lambda(
     config: LambdaProcessFileConfig,
 ) -> dict:
     """
-    Process a small file (< 50 MB) using AWS Lambda via the TypeScript lambda-cli.
-    The TS process invokes the Lambda, streams CloudWatch logs, and returns the result.
+    Process a small file (< 50 MB) using AWS Lambda via the TypeScript orchestrator.
+    Uses the persistent op worker when available (no per-run `node` startup
+    cost); falls back to spawning the one-shot lambda-cli otherwise.
+    The TS side invokes the Lambda, streams CloudWatch logs, and returns the result.
     """
 
     context.log.info("=" * 50)
@@ -51,40 +45,35 @@ def process_file_with_lambda(
     context.log.info("=" * 50)
     context.log.info(f"File: s3://{config.s3_bucket}/{config.s3_key}")
 
-    args = ["node", LAMBDA_CLI, config.s3_bucket, config.s3_key, context.run_id]
-
-    proc = subprocess.Popen(
-        args,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        env={**os.environ},
-    )
-
-    # Stream stderr (logs) in a separate thread for real-time output
-    error_lines = []
-    log_thread = threading.Thread(target=_stream_stderr, args=(proc, context, error_lines))
-    log_thread.daemon = True
-    log_thread.start()
-
-    # Wait for process to finish (max 5 min for Lambda)
     try:
-        stdout, _ = proc.communicate(timeout=300)
-    except subprocess.TimeoutExpired:
-        proc.kill()
-        raise Exception("lambda-cli timed out after 5 minutes")
-
-    log_thread.join(timeout=5)
-
-    if proc.returncode != 0:
-        error_detail = error_lines[-1] if error_lines else "See logs above for details"
-        raise Exception(f"lambda-cli failed (exit code {proc.returncode}): {error_detail}")
-
-    # Parse result JSON from stdout
-    result = json.loads(stdout.strip())
+        result = ts_worker.call_op(
+            context,
+            "lambda",
+            {
+                "s3Bucket": config.s3_bucket,
+                "s3Key": config.s3_key,
+                "runId": context.run_id,
+            },
+            timeout=300,
+        )
+    except ts_worker.WorkerUnavailable as e:
+        context.log.warning(f"TS worker unavailable ({e}), falling back to one-shot lambda-cli")
+        result = _run_lambda_cli(context, config)
 
     context.log.info("=" * 50)
     context.log.info(f"Result: {result['status']}")
     context.log.info("=" * 50)
 
     return result
+
+
+def _run_lambda_cli(context: OpExecutionContext, config: LambdaProcessFileConfig) -> dict:
+    """Fallback path: spawn the one-shot lambda-cli subprocess."""
+
+    args = ["node", LAMBDA_CLI, config.s3_bucket, config.s3_key, context.run_id]
+
+    # Drain stdout/stderr on the op thread (max 5 min for Lambda)
+    stdout = cli_process.run_cli(context, args, timeout=300, name="lambda-cli")
+
+    # Parse result JSON from stdout (bytes, whitespace tolerated)
+    return fast_json.loads(stdout)
@@ -0,0 +1,31 @@
+"""
+Shared bounded thread pool for finite background work.
+
+Ad-hoc daemon threads per task grow unboundedly with concurrent work in
+the code-location process. One small shared pool per Dagster process
+keeps the thread count flat. Only submit work that completes on its own
+(e.g. batched SQS deletes): pool threads are joined at interpreter exit,
+so a task that blocks forever would hang process shutdown.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+_MAX_WORKERS = int(os.environ.get("DAGSTER_POC_POOL_WORKERS", "8"))
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Process-wide bounded executor, created on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=_MAX_WORKERS,
+                    thread_name_prefix="dagster-poc-io",
+                )
+    return _executor
@@ -0,0 +1,183 @@
+"""
+Persistent TypeScript op worker client.
+
+Spawning `node dist/<cli>.js` per op pays Node startup plus AWS SDK
+initialization (a few hundred ms) on every run. This module keeps one
+long-lived worker process (dagster_ts/dist/op-worker.js) per Dagster
+process and talks to it over newline-delimited JSON:
+
+    stdin:  {"id": 1, "op": "fargate" | "lambda", "args": {...}}
+    stdout: {"id": 1, "type": "log", "level": "info", "message": "..."}
+            {"id": 1, "type": "result", "result": {...}}
+            {"id": 1, "type": "result", "resultFile": "/dev/shm/..."}
+            {"id": 1, "type": "error", "error": "..."}
+
+Requests run concurrently in the worker; responses are correlated by id.
+Results above the 64 KiB pipe buffer arrive as a resultFile pointing at a
+/dev/shm handoff (same scheme as sensor-cli.ts), mmapped and parsed
+zero-copy here. If the worker cannot be started (e.g. op-worker.js not
+built), callers fall back to the one-shot CLI path.
+"""
+
+import json
+import mmap
+import os
+import queue
+import subprocess
+import threading
+import time
+
+from . import fast_json
+
+# Path to the compiled TypeScript op worker (canonicalized once so execvp
+# never re-walks the .. components)
+OP_WORKER = os.path.realpath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "dagster_ts", "dist", "op-worker.js")
+)
+
+
+class WorkerUnavailable(Exception):
+    """Raised when the persistent worker cannot be started or dies mid-request."""
+
+
+def _load_shm_result(path: str) -> dict:
+    """Read a large worker result from its shared-memory handoff file."""
+    try:
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                return fast_json.loads(memoryview(buf))
+    finally:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+class _TSWorker:
+    """One long-lived `node op-worker.js` process shared by all ops."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._proc = None
+        self._next_id = 0
+        # request id -> queue.Queue of messages. Replaced (not reused) on
+        # every respawn and captured by that worker's reader thread, so an
+        # old worker's exit broadcast can only ever reach its own waiters.
+        self._pending = {}
+
+    def _ensure_started(self):
+        # self._proc is cleared by the reader thread the moment a worker
+        # dies; don't trust poll() alone, which can still return None for
+        # an exited-but-unreaped child and let a request be written into a
+        # dead process's stdin (where it would stall until its deadline).
+        if self._proc is not None and self._proc.poll() is None:
+            return
+        if not os.path.exists(OP_WORKER):
+            raise WorkerUnavailable(f"op-worker.js not found at {OP_WORKER}")
+
+        # Worker stderr is inherited so crash output still reaches the
+        # Dagster process logs; all normal traffic is NDJSON on stdout.
+        # The AWS env vars are inherited with the rest of the environment.
+        self._proc = subprocess.Popen(
+            ["node", OP_WORKER],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        self._pending = {}
+        # The reader lives as long as the worker process, so it stays a
+        # daemon thread (one per process, not one per op); pool threads are
+        # joined at interpreter exit and would deadlock on the open pipe.
+        reader = threading.Thread(target=self._read_loop, args=(self._proc, self._pending))
+        reader.daemon = True
+        reader.start()
+
+    def _read_loop(self, proc, pending):
+        """Dispatch worker stdout messages to the per-request queues."""
+        for line in iter(proc.stdout.readline, ""):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                msg = fast_json.loads(line)
+            except ValueError:
+                continue
+            waiter = pending.get(msg.get("id"))
+            if waiter is not None:
+                waiter.put(msg)
+        # stdout EOF: the worker is gone. Reap it and withdraw the process
+        # record *before* notifying waiters, so a call racing in right
+        # after the exit broadcast respawns instead of writing into the
+        # dying process.
+        proc.wait()
+        with self._lock:
+            if self._proc is proc:
+                self._proc = None
+        for waiter in pending.values():
+            waiter.put({"type": "exit"})
+
+    def call(self, context, op: str, args: dict, timeout: float) -> dict:
+        """Run one op on the worker, streaming its logs to Dagster.
+
+        ``context`` is any Dagster context exposing ``.log`` (op or sensor).
+        """
+        with self._lock:
+            self._ensure_started()
+            self._next_id += 1
+            request_id = self._next_id
+            messages = queue.Queue()
+            # Bind to the pending map of the worker the request is written
+            # to: a respawn swaps self._pending, but exit notifications are
+            # delivered per worker via the map its reader captured.
+            pending = self._pending
+            pending[request_id] = messages
+            try:
+                self._proc.stdin.write(
+                    json.dumps({"id": request_id, "op": op, "args": args}) + "\n"
+                )
+                self._proc.stdin.flush()
+            except (BrokenPipeError, OSError) as e:
+                pending.pop(request_id, None)
+                raise WorkerUnavailable(f"worker pipe closed: {e}")
+
+        deadline = time.monotonic() + timeout
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    # Abandon the request rather than killing the worker:
+                    # the process is shared across concurrent ops and
+                    # sensor ticks, so one timed-out request must not take
+                    # the others down with it. A stale response, if it ever
+                    # arrives, is dropped once the pending queue is removed
+                    # below; a genuinely dead worker is still detected via
+                    # its exit message and respawned on the next call.
+                    raise Exception(f"ts-worker op '{op}' timed out after {int(timeout)} seconds")
+                try:
+                    msg = messages.get(timeout=min(remaining, 5))
+                except queue.Empty:
+                    continue
+
+                msg_type = msg.get("type")
+                if msg_type == "log":
+                    level = msg.get("level", "info")
+                    log = getattr(context.log, level, context.log.info)
+                    log(f"[TS] {msg.get('message', '')}")
+                elif msg_type == "result":
+                    if "resultFile" in msg:
+                        return _load_shm_result(msg["resultFile"])
+                    return msg["result"]
+                elif msg_type == "error":
+                    raise Exception(f"ts-worker op '{op}' failed: {msg.get('error')}")
+                elif msg_type == "exit":
+                    raise WorkerUnavailable("worker process exited mid-request")
+        finally:
+            pending.pop(request_id, None)
+
+
+_worker = _TSWorker()
+
+
+def call_op(context, op: str, args: dict, timeout: float) -> dict:
+    """Run an op on the shared persistent worker."""
+    return _worker.call(context, op, args, timeout)
@@ -1,37 +1,134 @@
 """
-SQS Sensor - Thin Python wrapper that delegates to TypeScript.
-The actual SQS polling and S3 event parsing logic lives in dagster_ts/src/sensor-cli.ts
+SQS Sensor.
+
+SQS mode polls the queue in-process with boto3 long-polling — no fork/exec
+of a node subprocess per tick. S3 polling mode (S3_POLLING_ENABLED=true)
+still delegates to dagster_ts/src/sensor-cli.ts, which owns the
+DynamoDB-deduplicated bucket listing.
 
 Routes files to Lambda (< 50 MB) or Fargate (>= 50 MB) based on taskSize.
 Messages are deleted from SQS only after RunRequests are successfully yielded.
 """
 
 import json
+import mmap
 import os
 import subprocess
+import time
+from concurrent.futures import as_completed
 
-import boto3
 from dagster import DefaultSensorStatus, RunConfig, RunRequest, SensorEvaluationContext, sensor
 
 from ..jobs.fargate_job import fargate_job
 from ..jobs.lambda_job import lambda_job
+from ..ops import fast_json, thread_pool, ts_worker
 from ..ops.fargate_ops import ProcessFileConfig
 from ..ops.lambda_ops import LambdaProcessFileConfig
 
-# Path to the compiled TypeScript sensor CLI
-SENSOR_CLI = os.path.join(
-    os.path.dirname(__file__), "..", "..", "dagster_ts", "dist", "sensor-cli.js"
+_MB = 1 << 20
+
+# Shared tag sentinels for the routing loop. Never mutate these: the |
+# merge below always returns a fresh dict, so sharing is safe.
+_EMPTY_TAGS: dict = {}
+_LAMBDA_TAGS = {"execution_type": "lambda"}
+_FARGATE_TAGS = {"execution_type": "fargate"}
+
+# Integer byte thresholds for task-size routing: the per-record hot path
+# compares raw sizes without any float division
+_LAMBDA_MAX_BYTES = 50 * _MB
+_MEDIUM_MAX_BYTES = 200 * _MB
+_LARGE_MAX_BYTES = 500 * _MB
+
+# Path to the compiled TypeScript sensor CLI. Canonicalized at import so
+# execvp never re-walks the .. components, and stat-ed once here instead
+# of on every fallback spawn. Kept non-fatal: SQS mode never touches the
+# CLI, so a missing TS build must not break definitions loading.
+SENSOR_CLI = os.path.realpath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "dagster_ts", "dist", "sensor-cli.js")
 )
+_SENSOR_CLI_EXISTS = os.path.isfile(SENSOR_CLI)
+
+# SQS client cached across sensor ticks. Construction is expensive (service
+# model load, endpoint resolution, fresh urllib3 pool); reusing one client
+# also keeps TCP connections alive between ticks.
+_SQS_CLIENT = None
+
+
+def _get_sqs_client():
+    global _SQS_CLIENT
+    if _SQS_CLIENT is None:
+        # Deferred import: AWS SDK import costs 100-300 ms and Dagster
+        # reloads this module in every cold process (grpc code server,
+        # webserver workers), most of which never poll SQS. botocore is
+        # used directly — the low-level client is all this module needs,
+        # and skipping boto3 skips its resource-model machinery too.
+        import botocore.config
+        import botocore.session
+
+        _SQS_CLIENT = botocore.session.get_session().create_client(
+            "sqs",
+            region_name=os.environ.get("AWS_DEFAULT_REGION", "us-east-1"),
+            # Pool at least as wide as the thread pool, otherwise concurrent
+            # batch deletes serialize on urllib3 connection checkout
+            config=botocore.config.Config(
+                max_pool_connections=16,
+                retries={"max_attempts": 3, "mode": "adaptive"},
+            ),
+        )
+    return _SQS_CLIENT
+
+
+def _direct_lambda_enabled() -> bool:
+    """Direct-execution fast path for lambda-sized files.
+
+    Invokes the Lambda straight from the sensor tick, skipping the Dagster
+    run submission round-trip (run launch + new process + definitions load).
+    Opt-in via SENSOR_DIRECT_LAMBDA=true because it trades away per-run
+    observability in the Dagster UI.
+    """
+    return os.environ.get("SENSOR_DIRECT_LAMBDA", "").lower() == "true"
+
+
+# Per-branch RunConfig factories, compiled once at module scope: the ops
+# dict literal and its key string live in each function's constants rather
+# than being rebuilt from scratch inside the routing loop. Both share one
+# signature so the loop can pick a factory and call it unconditionally.
+
+
+def _lambda_run_config(s3_bucket: str, s3_key: str, task_size: str, s3_etag: str | None) -> RunConfig:
+    return RunConfig(
+        ops={
+            "process_file_with_lambda": LambdaProcessFileConfig(
+                s3_bucket=s3_bucket,
+                s3_key=s3_key,
+            )
+        }
+    )
+
+
+def _fargate_run_config(s3_bucket: str, s3_key: str, task_size: str, s3_etag: str | None) -> RunConfig:
+    return RunConfig(
+        ops={
+            "process_file_with_pipes": ProcessFileConfig(
+                s3_bucket=s3_bucket,
+                s3_key=s3_key,
+                task_size=task_size,
+                s3_etag=s3_etag,
+            )
+        }
+    )
 
 
 @sensor(jobs=[fargate_job, lambda_job], minimum_interval_seconds=30, default_status=DefaultSensorStatus.RUNNING)
 def s3_file_sensor(context: SensorEvaluationContext):
     """
-    Sensor that calls the TypeScript sensor-cli to poll SQS for S3 file events.
-    The TS process does all the work; Python just bridges the results to Dagster.
+    Sensor that polls for new S3 files and routes them to the right job.
+
+    SQS mode long-polls the queue directly in-process; S3 polling mode
+    (S3_POLLING_ENABLED=true) shells out to the TypeScript sensor-cli.
 
-    Messages are NOT deleted by the TS sensor-cli. Instead, this Python sensor
-    deletes them after successfully yielding all RunRequests. If this sensor
+    Messages are NOT deleted while polling. Instead, this sensor deletes
+    them after successfully yielding all RunRequests. If this sensor
     fails, messages stay in SQS and get retried (or go to DLQ after 3 attempts).
 
     Routing:
@@ -39,29 +136,17 @@ def s3_file_sensor(context: SensorEvaluationContext):
       - taskSize == medium/large/xlarge  -> fargate_job
     """
 
-    try:
-        result = subprocess.run(
-            ["node", SENSOR_CLI],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            env={**os.environ},
-        )
-
-        # TS logs go to stderr - forward them to Dagster
-        for line in result.stderr.strip().splitlines():
-            if line:
-                context.log.info(f"[TS] {line}")
+    use_s3_polling = os.environ.get("S3_POLLING_ENABLED", "").lower() == "true"
 
-        if result.returncode != 0:
-            context.log.error(f"sensor-cli failed (exit {result.returncode})")
-            return
+    try:
+        if use_s3_polling:
+            output = _poll_via_sensor_cli(context)
+        else:
+            output = _poll_sqs_inprocess(context)
 
-        if not result.stdout.strip():
+        if output is None:
             return
 
-        # Parse JSON output from TS: { runRequests: [...], receiptHandles: [...] }
-        output = json.loads(result.stdout)
         requests = output.get("runRequests", [])
         receipt_handles = output.get("receiptHandles", [])
 
@@ -71,46 +156,68 @@ def s3_file_sensor(context: SensorEvaluationContext):
             _delete_sqs_messages(context, receipt_handles)
             return
 
+        # Build the whole batch first, then emit it in one pass: the
+        # delete-after-yield invariant only needs "all built successfully",
+        # and batching keeps per-request work out of the yield path.
+        # Branch constants are hoisted so the loop body is one RunRequest
+        # construction site with the fewest per-request lookups.
+        run_requests = []
+        direct_lambda = _direct_lambda_enabled()
+
         for req in requests:
-            s3_bucket = req["config"]["s3Bucket"]
-            s3_key = req["config"]["s3Key"]
-            task_size = req["config"].get("taskSize", "")
+            cfg = req["config"]
+            s3_bucket = cfg["s3Bucket"]
+            s3_key = cfg["s3Key"]
+            task_size = cfg.get("taskSize", "")
+            is_lambda = task_size == "lambda"
 
-            context.log.info(f"File detected: s3://{s3_bucket}/{s3_key} (taskSize={task_size})")
+            # One terse line per file: routing details are already on the
+            # run's tags, and each extra log call costs a full pass through
+            # Dagster's structured-event pipeline (300+ records per tick
+            # for a 100-file burst at three calls per file).
+            context.log.info(
+                f"s3://{s3_bucket}/{s3_key} -> {'lambda' if is_lambda else f'fargate/{task_size}'}"
+            )
 
-            if task_size == "lambda":
+            if is_lambda and direct_lambda:
+                # Small files (< 50 MB) -> Lambda, direct-execution fast path
+                context.log.info(f"Direct-executing Lambda (fast path): {s3_key}")
+                try:
+                    ts_worker.call_op(
+                        context,
+                        "lambda",
+                        {"s3Bucket": s3_bucket, "s3Key": s3_key, "runId": req["runKey"]},
+                        timeout=300,
+                    )
+                    continue
+                except Exception as e:
+                    context.log.warning(
+                        f"Direct Lambda execution failed ({e}); submitting lambda_job run instead"
+                    )
+
+            if is_lambda:
                 # Small files (< 50 MB) -> Lambda
-                context.log.info(f"Routing to Lambda: {s3_key}")
-                yield RunRequest(
-                    run_key=req["runKey"],
-                    job_name="lambda_job",
-                    run_config=RunConfig(
-                        ops={
-                            "process_file_with_lambda": LambdaProcessFileConfig(
-                                s3_bucket=s3_bucket,
-                                s3_key=s3_key,
-                            )
-                        }
-                    ),
-                    tags={**req.get("tags", {}), "execution_type": "lambda"},
-                )
+                job_name = "lambda_job"
+                make_run_config = _lambda_run_config
+                execution_tags = _LAMBDA_TAGS
             else:
                 # Larger files (>= 50 MB) -> Fargate
-                context.log.info(f"Routing to Fargate ({task_size}): {s3_key}")
-                yield RunRequest(
+                job_name = "fargate_job"
+                make_run_config = _fargate_run_config
+                execution_tags = _FARGATE_TAGS
+
+            run_requests.append(
+                RunRequest(
                     run_key=req["runKey"],
-                    job_name="fargate_job",
-                    run_config=RunConfig(
-                        ops={
-                            "process_file_with_pipes": ProcessFileConfig(
-                                s3_bucket=s3_bucket,
-                                s3_key=s3_key,
-                                task_size=task_size,
-                            )
-                        }
-                    ),
-                    tags={**req.get("tags", {}), "execution_type": "fargate"},
+                    job_name=job_name,
+                    run_config=make_run_config(s3_bucket, s3_key, task_size, cfg.get("s3Etag")),
+                    # PEP 584 merge: one C-level dict merge, no unpack
+                    # intermediary, and no fresh {} default per request
+                    tags=(req.get("tags") or _EMPTY_TAGS) | execution_tags,
                 )
+            )
+
+        yield from run_requests
 
         # All RunRequests yielded successfully — now delete messages from SQS
         _delete_sqs_messages(context, receipt_handles)
@@ -123,6 +230,280 @@ def s3_file_sensor(context: SensorEvaluationContext):
         context.log.error(f"Error running sensor-cli: {e}")
 
 
+def _poll_via_sensor_cli(context: SensorEvaluationContext) -> dict | None:
+    """Delegate a poll to the TS orchestrator (S3 polling mode).
+
+    Prefers the persistent op worker — a resident Node process serving
+    requests over its stdio pipe — so each 30s tick costs one small IPC
+    round-trip instead of a fork/exec plus Node and AWS SDK startup.
+    Falls back to spawning the one-shot sensor-cli when the worker is
+    unavailable.
+    """
+
+    try:
+        return ts_worker.call_op(context, "sensor", {}, timeout=30)
+    except ts_worker.WorkerUnavailable as e:
+        context.log.warning(f"TS worker unavailable ({e}), falling back to one-shot sensor-cli")
+
+    if not _SENSOR_CLI_EXISTS:
+        context.log.error(
+            f"TS sensor CLI not found at {SENSOR_CLI} — run `npm run build` in dagster_ts/"
+        )
+        return None
+
+    # env is inherited from this process; passing env={**os.environ}
+    # would just rebuild the same mapping for every spawn. Output stays
+    # bytes (no text=True): stderr is decoded lazily per line, and stdout
+    # feeds fast_json straight from the bytes buffer.
+    result = subprocess.run(
+        ["node", SENSOR_CLI],
+        capture_output=True,
+        timeout=30,
+    )
+
+    # TS logs go to stderr - forward them to Dagster. Skipped entirely on
+    # quiet ticks (the common case): no stdout and a clean exit means no
+    # work, so don't pay splitlines/strip on stderr every 30s for nothing.
+    empty_stdout = not result.stdout or result.stdout.isspace()
+    if empty_stdout and result.returncode == 0:
+        return None
+
+    if result.stderr:
+        # One multi-line record instead of a log call per line: Dagster
+        # runs its formatter and structured-event capture per call, which
+        # dominates the tick on verbose polls.
+        ts_lines = [
+            line.strip().decode("utf-8", "replace")
+            for line in result.stderr.splitlines()
+            if line and not line.isspace()
+        ]
+        if ts_lines:
+            context.log.info("[TS]\n" + "\n".join(ts_lines))
+
+    if result.returncode != 0:
+        context.log.error(f"sensor-cli failed (exit {result.returncode})")
+        return None
+
+    stdout = result.stdout.strip()
+
+    # Large batches are handed off via /dev/shm; only the path crosses the pipe
+    if stdout.startswith(b"@file:"):
+        return _load_shm_payload(stdout[len(b"@file:"):].decode("utf-8"))
+
+    # Parse JSON output from TS: { runRequests: [...], receiptHandles: [...] }
+    return fast_json.loads(stdout)
+
+
+def _load_shm_payload(path: str) -> dict:
+    """Read a large sensor-cli payload from its shared-memory file.
+
+    The CLI writes batches above the 64 KiB kernel pipe buffer to /dev/shm
+    and prints only the path; mmap gives the parser a zero-copy view of the
+    bytes instead of round-tripping the whole list through the pipe.
+    """
+    try:
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                return fast_json.loads(memoryview(buf))
+    finally:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def _poll_sqs_inprocess(context: SensorEvaluationContext) -> dict | None:
+    """Poll SQS directly and build run-request dicts in-process.
+
+    Long-polls the queue (server-side wait, no subprocess per tick) and
+    returns the same shape the TS sensor-cli emits:
+    {"runRequests": [...], "receiptHandles": [...]}.
+    """
+
+    queue_url = os.environ.get("SQS_QUEUE_URL")
+    if not queue_url:
+        context.log.error("Missing SQS_QUEUE_URL")
+        return None
+
+    sqs_client = _get_sqs_client()
+
+    run_requests = []
+    receipt_handles = []
+
+    # Drain the backlog within a soft wall-clock cap instead of stopping at
+    # one 10-message batch per tick (10 is the per-call API maximum, and
+    # ReceiveMessage has no paginator). The first receive long-polls at the
+    # SQS cap of 20s so an idle queue costs one request per window; drain
+    # iterations drop to a 1s wait so an emptied queue ends the tick fast.
+    deadline = time.monotonic() + 25
+    wait_seconds = 20
+
+    while True:
+        response = sqs_client.receive_message(
+            QueueUrl=queue_url,
+            MaxNumberOfMessages=10,
+            WaitTimeSeconds=wait_seconds,
+        )
+        messages = response.get("Messages", [])
+        if not messages:
+            break
+
+        _collect_run_requests(context, messages, run_requests, receipt_handles)
+
+        if time.monotonic() >= deadline:
+            break
+        wait_seconds = 1
+
+    return {"runRequests": run_requests, "receiptHandles": receipt_handles}
+
+
+def _collect_run_requests(
+    context: SensorEvaluationContext,
+    messages: list[dict],
+    run_requests: list[dict],
+    receipt_handles: list[str],
+):
+    """Turn one batch of SQS messages into run-request dicts (in place)."""
+
+    for message in messages:
+        try:
+            body = message.get("Body")
+            if not body:
+                context.log.warning(f"Message missing body: {message.get('MessageId')}")
+                continue
+
+            for record in _parse_s3_records(body):
+                enrichment = record.get("enrichment_data")
+
+                # Skip unregistered files from enrichment
+                if enrichment and not enrichment.get("registered"):
+                    context.log.info(
+                        f"Skipping unregistered file: s3://{record['bucket']}/{record['key']}"
+                    )
+                    continue
+
+                # Routing: LAMBDA = always Lambda, AUTO/absent = size-based
+                if enrichment and enrichment.get("compute_target") == "LAMBDA":
+                    task_size = "lambda"
+                else:
+                    task_size = _recommended_task_size(record["size"])
+
+                tags = {
+                    "s3_bucket": record["bucket"],
+                    "s3_key": record["key"],
+                    "file_size_mb": f"{record['size'] / _MB:.2f}",
+                    "task_size": task_size,
+                }
+                if enrichment:
+                    if enrichment.get("dataset_id"):
+                        tags["dataset_id"] = enrichment["dataset_id"]
+                    if enrichment.get("schema_version"):
+                        tags["schema_version"] = str(enrichment["schema_version"])
+
+                run_requests.append(
+                    {
+                        "runKey": f"{record['bucket']}/{record['key']}/{record['etag']}",
+                        "config": {
+                            "s3Bucket": record["bucket"],
+                            "s3Key": record["key"],
+                            "taskSize": task_size,
+                            "s3Etag": record["etag"],
+                        },
+                        "tags": tags,
+                    }
+                )
+
+            # Collect receipt handle for deletion after successful run creation
+            if message.get("ReceiptHandle"):
+                receipt_handles.append(message["ReceiptHandle"])
+        except json.JSONDecodeError:
+            context.log.error(f"Invalid JSON in message: {message.get('Body')}")
+        except Exception as e:
+            context.log.error(f"Error processing message: {e}")
+
+
+def _parse_s3_records(body: str) -> list[dict]:
+    """Parse S3 event records from an SQS message body.
+
+    Supports both raw S3 events and enriched events from EventBridge Pipe
+    (port of parseS3Records in dagster_ts/src/sensor.ts).
+    """
+
+    # orjson when available: ~3-5x faster on the 1-4 KB event bodies, and
+    # with up to 10 messages per receive this parse runs per message on
+    # every busy tick. Raises a json.JSONDecodeError subclass either way.
+    parsed = fast_json.loads(body)
+
+    # Enriched event from EventBridge Pipe
+    enrichment = None
+    if parsed.get("original_event") and parsed.get("enrichment_data"):
+        enrichment = parsed["enrichment_data"]
+        s3_event = parsed["original_event"]
+    else:
+        # Raw S3 event format (backward compatibility)
+        s3_event = parsed
+
+    raw_records = s3_event.get("Records")
+    if not raw_records:
+        return []
+
+    # S3 emits one event per object operation, so Records is a singleton
+    # in practice (the array shape is a legacy API artifact). Specialize
+    # that case; the loop only runs for the rare multi-record message.
+    if len(raw_records) == 1:
+        parsed_record = _parse_s3_record(raw_records[0], enrichment)
+        return [parsed_record] if parsed_record else []
+
+    records = []
+    for record in raw_records:
+        parsed_record = _parse_s3_record(record, enrichment)
+        if parsed_record:
+            records.append(parsed_record)
+
+    return records
+
+
+def _parse_s3_record(record: dict, enrichment: dict | None) -> dict | None:
+    """Parse one S3 event record; returns None for malformed records."""
+
+    # Well-formed events are the overwhelmingly common case: index
+    # directly and let one KeyError handle malformed records, instead
+    # of .get() chains that walk the dicts field by field with
+    # empty-dict sentinels.
+    try:
+        s3_info = record["s3"]
+        s3_object = s3_info["object"]
+        bucket = s3_info["bucket"]["name"]
+        key = s3_object["key"]
+    except KeyError:
+        return None
+
+    if not (bucket and key):
+        return None
+
+    parsed_record = {
+        "bucket": bucket,
+        "key": key,
+        "size": s3_object.get("size", 0),
+        "etag": s3_object.get("eTag", ""),
+    }
+    if enrichment is not None:
+        parsed_record["enrichment_data"] = enrichment
+    return parsed_record
+
+
+def _recommended_task_size(size_bytes: int) -> str:
+    """Size-based routing (port of S3Resource.getRecommendedTaskSize)."""
+
+    if size_bytes < _LAMBDA_MAX_BYTES:
+        return "lambda"
+    if size_bytes < _MEDIUM_MAX_BYTES:
+        return "medium"
+    if size_bytes < _LARGE_MAX_BYTES:
+        return "large"
+    return "xlarge"
+
+
 def _delete_sqs_messages(context: SensorEvaluationContext, receipt_handles: list[str]):
     """Delete SQS messages by receipt handle after successful processing."""
     if not receipt_handles:
@@ -133,13 +514,33 @@ def _delete_sqs_messages(context: SensorEvaluationContext, receipt_handles: list
         context.log.warning("SQS_QUEUE_URL not set, cannot delete messages")
         return
 
-    region = os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
-    sqs_client = boto3.client("sqs", region_name=region)
+    sqs_client = _get_sqs_client()
 
-    for handle in receipt_handles:
+    def _delete_batch(batch: list[str]) -> dict:
+        entries = [{"Id": str(j), "ReceiptHandle": h} for j, h in enumerate(batch)]
+        return sqs_client.delete_message_batch(QueueUrl=queue_url, Entries=entries)
+
+    # DeleteMessageBatch takes up to 10 entries per call: one round-trip
+    # per 10 handles instead of one per handle. The batches are independent
+    # network-bound calls, so overlap them on the shared I/O pool.
+    batches = [receipt_handles[i : i + 10] for i in range(0, len(receipt_handles), 10)]
+    executor = thread_pool.get_executor()
+    futures = {executor.submit(_delete_batch, batch): batch for batch in batches}
+
+    deleted = 0
+    for future in as_completed(futures):
+        batch = futures[future]
         try:
-            sqs_client.delete_message(QueueUrl=queue_url, ReceiptHandle=handle)
+            response = future.result()
         except Exception as e:
-            context.log.warning(f"Failed to delete SQS message: {e}")
+            context.log.warning(f"Failed to delete SQS message batch: {e}")
+            continue
+
+        deleted += len(response.get("Successful", []))
+        for failure in response.get("Failed", []):
+            context.log.warning(
+                f"Failed to delete SQS message {batch[int(failure['Id'])][:32]}...: "
+                f"{failure.get('Code')}: {failure.get('Message')}"
+            )
 
-    context.log.info(f"Deleted {len(receipt_handles)} SQS message(s)")
+    context.log.info(f"Deleted {deleted} SQS message(s)")
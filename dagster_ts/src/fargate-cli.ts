@@ -2,7 +2,7 @@
  * Fargate CLI - Launches an ECS Fargate task and streams CloudWatch logs.
  * Called by the Python Dagster op as a subprocess.
  *
- * Usage: node dist/fargate-cli.js <s3_bucket> <s3_key> [task_size] [run_id]
+ * Usage: node dist/fargate-cli.js <s3_bucket> <s3_key> [task_size] [run_id] [s3_etag]
  * Env: ECS_CLUSTER_NAME, ECS_SUBNETS, ECS_SECURITY_GROUPS, ECS_LOG_GROUP_NAME,
  *      DYNAMO_TABLE_NAME, ECS_TASK_DEFINITION_SMALL/MEDIUM/LARGE/XLARGE
  *
@@ -28,7 +28,7 @@ function csvEnv(name: string): string[] {
 }
 
 async function main() {
-  const [s3Bucket, s3Key, taskSize, runId] = process.argv.slice(2);
+  const [s3Bucket, s3Key, taskSize, runId, s3Etag] = process.argv.slice(2);
 
   if (!s3Bucket || !s3Key) {
     console.error("Usage: fargate-cli <s3_bucket> <s3_key> [task_size] [run_id]");
@@ -60,7 +60,7 @@ async function main() {
   };
 
   const result = await processFileWithPipes(
-    { s3Bucket, s3Key, taskSize: taskSize || undefined },
+    { s3Bucket, s3Key, taskSize: taskSize || undefined, s3Etag: s3Etag || undefined },
     ecs,
     s3,
     logger,
@@ -4,13 +4,12 @@
  * Launches ECS Fargate tasks and streams CloudWatch logs.
  */
 
+import { RunTaskCommand } from "@aws-sdk/client-ecs";
+import type { Task } from "@aws-sdk/client-ecs";
 import {
-  RunTaskCommand,
-  DescribeTasksCommand,
-} from "@aws-sdk/client-ecs";
-import {
-  CloudWatchLogsClient,
   FilterLogEventsCommand,
+  StartLiveTailCommand,
+  paginateFilterLogEvents,
 } from "@aws-sdk/client-cloudwatch-logs";
 import type { ECSResource, S3Resource } from "./resources";
 import type { Logger } from "./sensor";
@@ -21,6 +20,7 @@ export interface ProcessFileConfig {
   s3Bucket: string;
   s3Key: string;
   taskSize?: string; // auto-detect if undefined
+  s3Etag?: string; // enables cached file-size lookups when known
 }
 
 export interface FargateResult {
@@ -38,6 +38,13 @@ function sleep(ms: number): Promise<void> {
   return new Promise((resolve) => setTimeout(resolve, ms));
 }
 
+/** Common shape of Live Tail session events and FilterLogEvents results. */
+interface WorkerLogEvent {
+  eventId?: string;
+  timestamp?: number;
+  message?: string;
+}
+
 // ─── Main Operation ─────────────────────────────────────────────
 
 export async function processFileWithPipes(
@@ -56,7 +63,7 @@ export async function processFileWithPipes(
   logger.info(`File: s3://${config.s3Bucket}/${config.s3Key}`);
 
   // 1. Get file size and determine task size
-  const fileSize = await s3.getFileSize(config.s3Bucket, config.s3Key);
+  const fileSize = await s3.getFileSize(config.s3Bucket, config.s3Key, config.s3Etag);
   const fileSizeMb = fileSize / (1024 * 1024);
   const taskSize = config.taskSize ?? s3.getRecommendedTaskSize(fileSize);
 
@@ -75,7 +82,7 @@ export async function processFileWithPipes(
   logger.info("Launching Fargate task...");
 
   const ecsClient = ecs.getClient();
-  const logsClient = new CloudWatchLogsClient({ region: ecs.regionName });
+  const logsClient = ecs.getLogsClient();
 
   const runTaskResponse = await ecsClient.send(
     new RunTaskCommand({
@@ -120,7 +127,6 @@ export async function processFileWithPipes(
   logger.info("FARGATE WORKER LOGS:");
   logger.info(dash);
 
-  let lastLogToken: string | undefined;
   let taskRunning = true;
   const startTime = Date.now();
   const maxWaitMs = 900_000; // 15 minutes
@@ -128,23 +134,108 @@ export async function processFileWithPipes(
   let exitCode: number | null = null;
   const workerErrors: string[] = [];
 
-  while (taskRunning && Date.now() - startTime < maxWaitMs) {
-    // Check task status
-    const describeResponse = await ecsClient.send(
-      new DescribeTasksCommand({
-        cluster: ecs.clusterName,
-        tasks: [taskArn],
+  // Live Tail is server-push: one API call per run instead of one
+  // FilterLogEvents call every 2s, which hits account-wide CloudWatch rate
+  // limits under concurrent runs (and returns duplicate events). A background
+  // reader pushes session events into eventQueue; the main loop drains it
+  // between task-status checks.
+  const eventQueue: WorkerLogEvent[] = [];
+  const seenEventIds = new Set<string>();
+  let lastEventTs = 0;
+  let liveTailActive = false;
+  const liveTailAbort = new AbortController();
+
+  const emitWorkerEvent = (event: WorkerLogEvent): void => {
+    // Live Tail and FilterLogEvents can overlap; dedupe before logging.
+    const eventKey = event.eventId ?? `${event.timestamp}:${event.message}`;
+    if (seenEventIds.has(eventKey)) {
+      return;
+    }
+    seenEventIds.add(eventKey);
+
+    if (event.timestamp && event.timestamp > lastEventTs) {
+      lastEventTs = event.timestamp;
+    }
+
+    const message = (event.message ?? "").trim();
+    if (message) {
+      logger.info(`[WORKER] ${message}`);
+      if (message.includes("[ERROR")) {
+        workerErrors.push(message);
+      }
+    }
+  };
+
+  // Live Tail takes log group ARNs; build one from the task ARN's account.
+  const accountId = taskArn.split(":")[4];
+  const logGroupArn = `arn:aws:logs:${ecs.regionName}:${accountId}:log-group:${logGroup}`;
+
+  try {
+    const tailResponse = await logsClient.send(
+      new StartLiveTailCommand({
+        logGroupIdentifiers: [logGroupArn],
+        logStreamNamePrefixes: [logStreamPrefix],
       }),
+      { abortSignal: liveTailAbort.signal },
     );
 
-    const describedTasks = describeResponse.tasks ?? [];
-    if (describedTasks.length > 0) {
-      const taskStatus = describedTasks[0].lastStatus;
+    const responseStream = tailResponse.responseStream;
+    if (responseStream) {
+      liveTailActive = true;
+      // Background reader: runs until the session ends or we abort it.
+      void (async () => {
+        try {
+          for await (const chunk of responseStream) {
+            const results = chunk.sessionUpdate?.sessionResults;
+            if (results && results.length > 0) {
+              eventQueue.push(...results);
+            }
+          }
+        } catch (error: any) {
+          if (error.name !== "AbortError") {
+            logger.warning(`Live Tail session ended: ${error}`);
+          }
+        } finally {
+          // Main loop falls back to FilterLogEvents if the task still runs.
+          liveTailActive = false;
+        }
+      })();
+    }
+  } catch (error: any) {
+    logger.warning(
+      `Live Tail unavailable (${error.name ?? error}), falling back to FilterLogEvents polling`,
+    );
+  }
+
+  // Logs arrive via Live Tail, so DescribeTasks only needs to detect STOPPED:
+  // back off exponentially instead of hammering it every 2s. The backoff
+  // resets on every task state transition (PROVISIONING -> PENDING ->
+  // RUNNING -> ...) since a transition makes another one likely soon.
+  const basePollDelayMs = 2000;
+  const maxPollDelayMs = 30_000;
+  // Without Live Tail, this loop is also the log poller: keep the interval
+  // bounded so log latency stays reasonable.
+  const maxFallbackDelayMs = 10_000;
+  let pollDelayMs = basePollDelayMs;
+  let lastStatus: string | undefined;
+  let stoppedTask: Task | undefined;
+
+  while (taskRunning && Date.now() - startTime < maxWaitMs) {
+    // Check task status (batched across concurrent ops via ECSResource)
+    const describedTask = await ecs.describeTaskBatched(taskArn);
+    if (describedTask) {
+      const taskStatus = describedTask.lastStatus;
+
+      if (taskStatus !== lastStatus) {
+        lastStatus = taskStatus;
+        pollDelayMs = basePollDelayMs;
+      }
 
       if (taskStatus === "STOPPED") {
         taskRunning = false;
-        const stopReason = describedTasks[0].stoppedReason ?? "";
-        const containers = describedTasks[0].containers ?? [];
+        stoppedTask = describedTask;
+        const stopReason = describedTask.stoppedReason ?? "";
+        const containers = describedTask.containers ?? [];
 
         const workerContainer = containers.find(c => c.name === "worker") ?? containers[0];
         if (workerContainer) {
@@ -159,84 +250,77 @@ export async function processFileWithPipes(
       }
     }
 
-    // Stream logs from CloudWatch
-    try {
-      const logParams: {
-        logGroupName: string;
-        logStreamNamePrefix: string;
-        interleaved: boolean;
-        nextToken?: string;
-      } = {
-        logGroupName: logGroup,
-        logStreamNamePrefix: logStreamPrefix,
-        interleaved: true,
-      };
-      if (lastLogToken) {
-        logParams.nextToken = lastLogToken;
-      }
-
-      const logResponse = await logsClient.send(
-        new FilterLogEventsCommand(logParams),
-      );
+    // Drain events pushed by the Live Tail reader
+    while (eventQueue.length > 0) {
+      emitWorkerEvent(eventQueue.shift()!);
+    }
 
-      for (const event of logResponse.events ?? []) {
-        const message = (event.message ?? "").trim();
-        if (message) {
-          logger.info(`[WORKER] ${message}`);
-          if (message.includes("[ERROR")) {
-            workerErrors.push(message);
-          }
+    if (!liveTailActive) {
+      // Fallback: poll with a startTime cursor. nextToken is only valid
+      // within a single query and drops events across separate calls.
+      try {
+        const logResponse = await logsClient.send(
+          new FilterLogEventsCommand({
+            logGroupName: logGroup,
+            logStreamNamePrefix: logStreamPrefix,
+            startTime: lastEventTs + 1,
+            interleaved: true,
+          }),
+        );
+
+        for (const event of logResponse.events ?? []) {
+          emitWorkerEvent(event);
+        }
+      } catch (error: any) {
+        if (error.name === "ResourceNotFoundException") {
+          // Log stream not yet created
+        } else {
+          logger.warning(`Error reading logs: ${error}`);
         }
-      }
-
-      if (logResponse.nextToken) {
-        lastLogToken = logResponse.nextToken;
-      }
-    } catch (error: any) {
-      if (error.name === "ResourceNotFoundException") {
-        // Log stream not yet created
-      } else {
-        logger.warning(`Error reading logs: ${error}`);
       }
     }
 
     if (taskRunning) {
-      await sleep(2000);
+      await sleep(Math.min(pollDelayMs, liveTailActive ? maxPollDelayMs : maxFallbackDelayMs));
+      pollDelayMs = Math.min(pollDelayMs * 2, maxPollDelayMs);
     }
   }
 
-  // 5. Final log fetch (re-fetch all to catch any missed error lines)
-  await sleep(2000);
+  liveTailAbort.abort();
+
+  // Drain anything the reader pushed after the last loop iteration
+  while (eventQueue.length > 0) {
+    emitWorkerEvent(eventQueue.shift()!);
+  }
+
+  // 5. Final log fetch (catch anything emitted after the last poll).
+  // Drains to EOF in one paginated pass from the startTime cursor — no
+  // blanket sleep first; the overlap at the boundary millisecond is
+  // absorbed by the eventId dedup in emitWorkerEvent.
   try {
-    const logResponse = await logsClient.send(
-      new FilterLogEventsCommand({
+    const paginator = paginateFilterLogEvents(
+      { client: logsClient },
+      {
         logGroupName: logGroup,
         logStreamNamePrefix: logStreamPrefix,
+        startTime: lastEventTs,
         interleaved: true,
-      }),
+      },
     );
-    for (const event of logResponse.events ?? []) {
-      const message = (event.message ?? "").trim();
-      if (message && message.includes("[ERROR") && !workerErrors.includes(message)) {
-        workerErrors.push(message);
-        logger.info(`[WORKER] ${message}`);
+    for await (const page of paginator) {
+      for (const event of page.events ?? []) {
+        emitWorkerEvent(event);
       }
     }
   } catch {
     // ignore
   }
 
-  // 6. Check final status
-  const finalResponse = await ecsClient.send(
-    new DescribeTasksCommand({
-      cluster: ecs.clusterName,
-      tasks: [taskArn],
-    }),
-  );
-
-  const finalTasks = finalResponse.tasks ?? [];
-  if (finalTasks.length > 0) {
-    const containers = finalTasks[0].containers ?? [];
+  // 6. Check final status. The wait loop already holds the STOPPED
+  // describe result; only the timeout path needs a fresh call.
+  const finalTask = stoppedTask ?? (await ecs.describeTaskBatched(taskArn));
+  if (finalTask) {
+    const containers = finalTask.containers ?? [];
     const finalWorkerContainer = containers.find(c => c.name === "worker") ?? containers[0];
     exitCode = finalWorkerContainer ? (finalWorkerContainer.exitCode ?? null) : null;
 
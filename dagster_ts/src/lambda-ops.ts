@@ -3,14 +3,8 @@
  * Parallel to fargate-ops.ts but for small files (< 50 MB).
  */
 
-import {
-  LambdaClient,
-  InvokeCommand,
-} from "@aws-sdk/client-lambda";
-import {
-  CloudWatchLogsClient,
-  FilterLogEventsCommand,
-} from "@aws-sdk/client-cloudwatch-logs";
+import { InvokeCommand } from "@aws-sdk/client-lambda";
+import { FilterLogEventsCommand } from "@aws-sdk/client-cloudwatch-logs";
 import type { LambdaResource } from "./resources";
 import type { Logger } from "./sensor";
 
@@ -58,8 +52,8 @@ export async function processFileWithLambda(
   // 1. Invoke Lambda synchronously
   logger.info("Invoking Lambda function...");
 
-  const lambdaClient = new LambdaClient({ region: lambda.regionName });
-  const logsClient = new CloudWatchLogsClient({ region: lambda.regionName });
+  const lambdaClient = lambda.getClient();
+  const logsClient = lambda.getLogsClient();
 
   const payload = {
     s3Bucket: config.s3Bucket,
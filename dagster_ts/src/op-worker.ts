@@ -0,0 +1,217 @@
+/**
+ * Op Worker - Long-lived replacement for the one-shot fargate/lambda CLIs.
+ *
+ * The Python ops used to spawn `node dist/<cli>.js` per run, paying Node
+ * startup plus AWS SDK init every time. This worker is started once per
+ * Dagster process (see dagster_poc/ops/ts_worker.py) and serves op
+ * requests over newline-delimited JSON:
+ *
+ *   stdin:  {"id": 1, "op": "fargate" | "lambda" | "sensor", "args": {...}}
+ *   stdout: {"id": 1, "type": "log", "level": "info", "message": "..."}
+ *           {"id": 1, "type": "result", "result": {...}}
+ *           {"id": 1, "type": "error", "error": "..."}
+ *
+ * Requests run concurrently; responses are correlated by id.
+ * Env: same variables as fargate-cli.ts / lambda-cli.ts.
+ */
+
+import { existsSync, writeFileSync } from "fs";
+import * as readline from "readline";
+import { ECSResource, S3Resource, LambdaResource, SQSResource } from "./resources";
+import { processFileWithPipes } from "./fargate-ops";
+import { processFileWithLambda } from "./lambda-ops";
+import { pollSensor } from "./sensor";
+import { pollS3Sensor } from "./s3-sensor";
+import type { Logger } from "./sensor";
+
+function requireEnv(name: string): string {
+  const value = process.env[name];
+  if (!value) throw new Error(`Missing ${name}`);
+  return value;
+}
+
+function optionalEnv(name: string, defaultValue = ""): string {
+  return process.env[name] ?? defaultValue;
+}
+
+function csvEnv(name: string): string[] {
+  const value = process.env[name];
+  return value ? value.split(",").map((s) => s.trim()).filter(Boolean) : [];
+}
+
+// ─── Lazy resource singletons ───────────────────────────────────
+// Built on first use so a lambda-only deployment doesn't need ECS env vars.
+
+const region = optionalEnv("AWS_DEFAULT_REGION", "us-east-1");
+
+let ecsResource: ECSResource | null = null;
+let s3Resource: S3Resource | null = null;
+let lambdaResource: LambdaResource | null = null;
+let sqsResource: SQSResource | null = null;
+
+function getEcs(): ECSResource {
+  if (!ecsResource) {
+    ecsResource = new ECSResource({
+      regionName: region,
+      clusterName: requireEnv("ECS_CLUSTER_NAME"),
+      subnets: csvEnv("ECS_SUBNETS"),
+      securityGroups: csvEnv("ECS_SECURITY_GROUPS"),
+      logGroupName: requireEnv("ECS_LOG_GROUP_NAME"),
+      dynamoTableName: optionalEnv("DYNAMO_TABLE_NAME"),
+      taskDefinitionSmall: optionalEnv("ECS_TASK_DEFINITION_SMALL"),
+      taskDefinitionMedium: optionalEnv("ECS_TASK_DEFINITION_MEDIUM"),
+      taskDefinitionLarge: optionalEnv("ECS_TASK_DEFINITION_LARGE"),
+      taskDefinitionXlarge: optionalEnv("ECS_TASK_DEFINITION_XLARGE"),
+    });
+  }
+  return ecsResource;
+}
+
+function getS3(): S3Resource {
+  if (!s3Resource) {
+    s3Resource = new S3Resource({ regionName: region });
+  }
+  return s3Resource;
+}
+
+function getLambda(): LambdaResource {
+  if (!lambdaResource) {
+    lambdaResource = new LambdaResource({
+      regionName: region,
+      functionName: requireEnv("LAMBDA_FUNCTION_NAME"),
+      logGroupName: requireEnv("LAMBDA_LOG_GROUP_NAME"),
+      dynamoTableName: optionalEnv("DYNAMO_TABLE_NAME"),
+    });
+  }
+  return lambdaResource;
+}
+
+function getSqs(): SQSResource {
+  if (!sqsResource) {
+    sqsResource = new SQSResource({
+      regionName: region,
+      queueUrl: requireEnv("SQS_QUEUE_URL"),
+    });
+  }
+  return sqsResource;
+}
+
+// ─── NDJSON protocol ────────────────────────────────────────────
+
+interface OpRequest {
+  id: number;
+  op: "fargate" | "lambda" | "sensor";
+  args: {
+    s3Bucket: string;
+    s3Key: string;
+    taskSize?: string | null;
+    runId?: string;
+    s3Etag?: string | null;
+  };
+}
+
+function send(message: Record<string, unknown>): void {
+  process.stdout.write(JSON.stringify(message) + "\n");
+}
+
+// Results above the 64 KiB kernel pipe buffer (e.g. a sensor poll over a
+// large burst) are handed off through shared memory: the JSON goes to a
+// /dev/shm file and only {"resultFile": path} crosses the pipe, where
+// Python mmaps it for a zero-copy parse. Same scheme as sensor-cli.ts.
+const SHM_DIR = "/dev/shm";
+const SHM_THRESHOLD_BYTES = 64 * 1024;
+
+function sendResult(id: number, result: unknown): void {
+  const payload = JSON.stringify(result);
+
+  if (payload.length > SHM_THRESHOLD_BYTES && existsSync(SHM_DIR)) {
+    const shmPath = `${SHM_DIR}/dagster-worker-${process.pid}-${id}.json`;
+    try {
+      writeFileSync(shmPath, payload);
+      send({ id, type: "result", resultFile: shmPath });
+      return;
+    } catch {
+      // /dev/shm not writable — fall back to the pipe
+    }
+  }
+
+  process.stdout.write(`{"id":${id},"type":"result","result":${payload}}\n`);
+}
+
+function makeLogger(id: number): Logger {
+  return {
+    info: (msg) => send({ id, type: "log", level: "info", message: msg }),
+    warning: (msg) => send({ id, type: "log", level: "warning", message: msg }),
+    error: (msg) => send({ id, type: "log", level: "error", message: msg }),
+  };
+}
+
+async function handleRequest(request: OpRequest): Promise<void> {
+  const logger = makeLogger(request.id);
+  try {
+    let result;
+    if (request.op === "fargate") {
+      result = await processFileWithPipes(
+        {
+          s3Bucket: request.args.s3Bucket,
+          s3Key: request.args.s3Key,
+          taskSize: request.args.taskSize || undefined,
+          s3Etag: request.args.s3Etag || undefined,
+        },
+        getEcs(),
+        getS3(),
+        logger,
+        request.args.runId,
+      );
+    } else if (request.op === "lambda") {
+      result = await processFileWithLambda(
+        { s3Bucket: request.args.s3Bucket, s3Key: request.args.s3Key },
+        getLambda(),
+        logger,
+        request.args.runId,
+      );
+    } else if (request.op === "sensor") {
+      // Same poll the one-shot sensor-cli performs, minus the per-tick
+      // Node startup. Mode selection mirrors sensor-cli.ts.
+      if (process.env.S3_POLLING_ENABLED === "true") {
+        result = {
+          runRequests: await pollS3Sensor({
+            s3: getS3(),
+            bucketName: requireEnv("S3_BUCKET_NAME"),
+            dynamoTableName: requireEnv("DYNAMO_TABLE_NAME"),
+            region,
+            logger,
+          }),
+          receiptHandles: [],
+        };
+      } else {
+        result = await pollSensor({ sqs: getSqs(), s3: getS3(), logger });
+      }
+    } else {
+      throw new Error(`Unknown op: ${(request as OpRequest).op}`);
+    }
+    sendResult(request.id, result);
+  } catch (error: any) {
+    send({ id: request.id, type: "error", error: error?.message ?? String(error) });
+  }
+}
+
+const rl = readline.createInterface({ input: process.stdin, terminal: false });
+
+rl.on("line", (line) => {
+  const trimmed = line.trim();
+  if (!trimmed) return;
+
+  let request: OpRequest;
+  try {
+    request = JSON.parse(trimmed);
+  } catch {
+    console.error(`[op-worker] Ignoring invalid request line`);
+    return;
+  }
+
+  // Requests run concurrently; responses are correlated by id.
+  void handleRequest(request);
+});
+
+rl.on("close", () => process.exit(0));
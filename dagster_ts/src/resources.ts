@@ -2,7 +2,8 @@
  * AWS Resources - TypeScript equivalent of dagster_poc/resources.py
  */
 
-import { ECSClient } from "@aws-sdk/client-ecs";
+import { ECSClient, DescribeTasksCommand } from "@aws-sdk/client-ecs";
+import type { Task } from "@aws-sdk/client-ecs";
 import {
   SQSClient,
   ReceiveMessageCommand,
@@ -13,6 +14,8 @@ import {
   HeadObjectCommand,
   ListObjectsV2Command,
 } from "@aws-sdk/client-s3";
+import { CloudWatchLogsClient } from "@aws-sdk/client-cloudwatch-logs";
+import { LambdaClient } from "@aws-sdk/client-lambda";
 
 // ─── ECS Resource ───────────────────────────────────────────────
 
@@ -29,6 +32,14 @@ export interface ECSResourceConfig {
   taskDefinitionXlarge: string;
 }
 
+interface NetworkConfig {
+  awsvpcConfiguration: {
+    subnets: string[];
+    securityGroups: string[];
+    assignPublicIp: "ENABLED" | "DISABLED";
+  };
+}
+
 export class ECSResource {
   readonly regionName: string;
   readonly clusterName: string;
@@ -42,6 +53,15 @@ export class ECSResource {
   readonly taskDefinitionXlarge: string;
 
   private client: ECSClient;
+  private logsClient: CloudWatchLogsClient | null = null;
+  private pendingDescribes = new Map<string, Array<(task: Task | undefined) => void>>();
+  private describeTimer: NodeJS.Timeout | null = null;
+
+  // Derived config precomputed once; these never change after construction,
+  // so there is no point rebuilding them on every op invocation.
+  private readonly taskDefinitionMap: Record<string, string>;
+  private readonly networkConfigPublic: NetworkConfig;
+  private readonly networkConfigPrivate: NetworkConfig;
 
   constructor(config: ECSResourceConfig) {
     this.regionName = config.regionName ?? "us-east-1";
@@ -55,23 +75,88 @@ export class ECSResource {
     this.taskDefinitionLarge = config.taskDefinitionLarge;
     this.taskDefinitionXlarge = config.taskDefinitionXlarge;
     this.client = new ECSClient({ region: this.regionName });
+
+    this.taskDefinitionMap = {
+      small: this.taskDefinitionSmall,
+      medium: this.taskDefinitionMedium,
+      large: this.taskDefinitionLarge,
+      xlarge: this.taskDefinitionXlarge,
+    };
+    this.networkConfigPublic = this.buildNetworkConfig(true);
+    this.networkConfigPrivate = this.buildNetworkConfig(false);
   }
 
   getClient(): ECSClient {
     return this.client;
   }
 
+  /** CloudWatch Logs client for the task log group, created once per resource. */
+  getLogsClient(): CloudWatchLogsClient {
+    if (!this.logsClient) {
+      this.logsClient = new CloudWatchLogsClient({ region: this.regionName });
+    }
+    return this.logsClient;
+  }
+
+  /**
+   * Describe a task through a shared batcher. Each in-flight op polls its own
+   * task ARN, but DescribeTasks accepts up to 100 ARNs per call — so requests
+   * arriving within the same 100ms window are coalesced into one API call.
+   * Resolves with undefined when the task is not (yet) returned by ECS.
+   */
+  describeTaskBatched(taskArn: string): Promise<Task | undefined> {
+    return new Promise((resolve) => {
+      const waiters = this.pendingDescribes.get(taskArn);
+      if (waiters) {
+        waiters.push(resolve);
+      } else {
+        this.pendingDescribes.set(taskArn, [resolve]);
+      }
+
+      if (!this.describeTimer) {
+        this.describeTimer = setTimeout(() => void this.flushDescribes(), 100);
+        // Don't keep the process alive just for the batcher
+        this.describeTimer.unref?.();
+      }
+    });
+  }
+
+  private async flushDescribes(): Promise<void> {
+    this.describeTimer = null;
+    const pending = this.pendingDescribes;
+    this.pendingDescribes = new Map();
+
+    const arns = [...pending.keys()];
+    for (let i = 0; i < arns.length; i += 100) {
+      const chunk = arns.slice(i, i + 100);
+      let tasks: Task[] = [];
+      try {
+        const response = await this.client.send(
+          new DescribeTasksCommand({ cluster: this.clusterName, tasks: chunk }),
+        );
+        tasks = response.tasks ?? [];
+      } catch {
+        // Waiters resolve with undefined; callers treat it as "no data yet"
+      }
+
+      const byArn = new Map(tasks.map((t) => [t.taskArn, t]));
+      for (const arn of chunk) {
+        for (const waiter of pending.get(arn) ?? []) {
+          waiter(byArn.get(arn));
+        }
+      }
+    }
+  }
+
   getTaskDefinition(taskSize: string): string {
-    const mapping: Record<string, string> = {
-      small: this.taskDefinitionSmall,
-      medium: this.taskDefinitionMedium,
-      large: this.taskDefinitionLarge,
-      xlarge: this.taskDefinitionXlarge,
-    };
-    return mapping[taskSize] ?? this.taskDefinitionSmall;
+    return this.taskDefinitionMap[taskSize] ?? this.taskDefinitionSmall;
+  }
+
+  getNetworkConfig(assignPublicIp = true): NetworkConfig {
+    return assignPublicIp ? this.networkConfigPublic : this.networkConfigPrivate;
   }
 
-  getNetworkConfig(assignPublicIp = true) {
+  private buildNetworkConfig(assignPublicIp: boolean): NetworkConfig {
     return {
       awsvpcConfiguration: {
         subnets: this.subnets,
@@ -144,12 +229,30 @@ export class LambdaResource {
   readonly logGroupName: string;
   readonly dynamoTableName: string;
 
+  private client: LambdaClient | null = null;
+  private logsClient: CloudWatchLogsClient | null = null;
+
   constructor(config: LambdaResourceConfig) {
     this.regionName = config.regionName ?? "us-east-1";
     this.functionName = config.functionName;
     this.logGroupName = config.logGroupName;
     this.dynamoTableName = config.dynamoTableName;
   }
+
+  getClient(): LambdaClient {
+    if (!this.client) {
+      this.client = new LambdaClient({ region: this.regionName });
+    }
+    return this.client;
+  }
+
+  /** CloudWatch Logs client for the function log group, created once per resource. */
+  getLogsClient(): CloudWatchLogsClient {
+    if (!this.logsClient) {
+      this.logsClient = new CloudWatchLogsClient({ region: this.regionName });
+    }
+    return this.logsClient;
+  }
 }
 
 // ─── S3 Resource ────────────────────────────────────────────────
@@ -158,9 +261,12 @@ export interface S3ResourceConfig {
   regionName?: string;
 }
 
+const FILE_SIZE_CACHE_MAX = 1024;
+
 export class S3Resource {
   readonly regionName: string;
   private client: S3Client;
+  private fileSizeCache = new Map<string, { etag: string; size: number }>();
 
   constructor(config: S3ResourceConfig = {}) {
     this.regionName = config.regionName ?? "us-east-1";
@@ -171,10 +277,44 @@ export class S3Resource {
     return this.client;
   }
 
-  async getFileSize(bucket: string, key: string): Promise<number> {
+  /**
+   * HeadObject with a small LRU cache keyed by (bucket, key, etag).
+   * A hit requires the caller to pass the etag it expects — the sensor has
+   * it from the S3 event — so a re-uploaded object never serves a stale
+   * size, and retries/re-runs of the same object skip the API call.
+   */
+  async getFileSize(bucket: string, key: string, etag?: string): Promise<number> {
+    const cacheKey = `${bucket}#${key}`;
+
+    if (etag) {
+      const wanted = etag.replace(/"/g, "");
+      const cached = this.fileSizeCache.get(cacheKey);
+      if (cached && cached.etag === wanted) {
+        // Refresh LRU position (Map preserves insertion order)
+        this.fileSizeCache.delete(cacheKey);
+        this.fileSizeCache.set(cacheKey, cached);
+        return cached.size;
+      }
+    }
+
     const command = new HeadObjectCommand({ Bucket: bucket, Key: key });
     const response = await this.client.send(command);
-    return response.ContentLength ?? 0;
+    const size = response.ContentLength ?? 0;
+
+    // HeadObject returns the ETag quoted; S3 event eTags are not
+    const responseEtag = (response.ETag ?? "").replace(/"/g, "");
+    if (responseEtag) {
+      this.fileSizeCache.delete(cacheKey);
+      this.fileSizeCache.set(cacheKey, { etag: responseEtag, size });
+      if (this.fileSizeCache.size > FILE_SIZE_CACHE_MAX) {
+        const oldest = this.fileSizeCache.keys().next().value;
+        if (oldest !== undefined) {
+          this.fileSizeCache.delete(oldest);
+        }
+      }
+    }
+
+    return size;
   }
 
   async listObjects(bucket: string): Promise<
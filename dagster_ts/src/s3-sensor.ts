@@ -16,6 +16,18 @@ export interface S3SensorOptions {
   logger: Logger;
 }
 
+// DynamoDB client cached across polls instead of rebuilt per tick
+let cachedDocClient: DynamoDBDocumentClient | null = null;
+let cachedDocClientRegion: string | null = null;
+
+function getDocClient(region: string): DynamoDBDocumentClient {
+  if (!cachedDocClient || cachedDocClientRegion !== region) {
+    cachedDocClient = DynamoDBDocumentClient.from(new DynamoDBClient({ region }));
+    cachedDocClientRegion = region;
+  }
+  return cachedDocClient;
+}
+
 /**
  * Check if a file has already been processed or is in progress.
  * Queries DynamoDB for the latest state of the file.
@@ -57,23 +69,42 @@ export async function pollS3Sensor(
   const { s3, dynamoTableName, bucketName, region, logger } = options;
   const runRequests: RunRequest[] = [];
 
-  const dynamoClient = new DynamoDBClient({ region });
-  const docClient = DynamoDBDocumentClient.from(dynamoClient);
+  const docClient = getDocClient(region);
 
   logger.info(`Listing objects in s3://${bucketName}`);
   const objects = await s3.listObjects(bucketName);
   logger.info(`Found ${objects.length} objects in bucket`);
 
-  for (const obj of objects) {
-    try {
-      const alreadyProcessed = await isAlreadyProcessed(
-        docClient,
-        dynamoTableName,
-        bucketName,
-        obj.key
-      );
+  // The per-file DynamoDB dedup query dominates poll time on large
+  // buckets; run the checks concurrently in bounded batches instead of
+  // strictly one at a time. Results keep listing order.
+  const DEDUP_CHECK_CONCURRENCY = 8;
+
+  for (let i = 0; i < objects.length; i += DEDUP_CHECK_CONCURRENCY) {
+    const batch = objects.slice(i, i + DEDUP_CHECK_CONCURRENCY);
+    const checks = await Promise.all(
+      batch.map(async (obj) => {
+        try {
+          const processed = await isAlreadyProcessed(
+            docClient,
+            dynamoTableName,
+            bucketName,
+            obj.key
+          );
+          return { obj, processed, error: null as unknown };
+        } catch (error) {
+          return { obj, processed: true, error };
+        }
+      })
+    );
+
+    for (const { obj, processed, error } of checks) {
+      if (error) {
+        logger.error(`Error checking file ${obj.key}: ${error}`);
+        continue;
+      }
 
-      if (alreadyProcessed) {
+      if (processed) {
         continue;
       }
 
@@ -91,6 +122,7 @@ export async function pollS3Sensor(
           s3Bucket: bucketName,
           s3Key: obj.key,
           taskSize,
+          s3Etag: obj.etag,
         },
         tags: {
           s3_bucket: bucketName,
@@ -101,8 +133,6 @@ export async function pollS3Sensor(
           task_size: taskSize,
         },
       });
-    } catch (error) {
-      logger.error(`Error checking file ${obj.key}: ${error}`);
     }
   }
 
@@ -110,6 +140,5 @@ export async function pollS3Sensor(
     `S3 poll complete: ${runRequests.length} new files to process`
   );
 
-  dynamoClient.destroy();
   return runRequests;
 }
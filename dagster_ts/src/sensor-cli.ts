@@ -13,10 +13,18 @@
  * Messages are NOT deleted here — Python deletes after successful run creation.
  */
 
+import { existsSync, writeFileSync } from "fs";
 import { SQSResource, S3Resource } from "./resources";
 import { pollSensor } from "./sensor";
 import { pollS3Sensor } from "./s3-sensor";
 
+// Payloads above the default 64 KiB kernel pipe buffer are handed off via
+// a shared-memory file instead of stdout: only the path crosses the pipe,
+// and Python mmaps the file for a zero-copy parse. Small payloads keep the
+// plain pipe path.
+const SHM_DIR = "/dev/shm";
+const SHM_THRESHOLD_BYTES = 64 * 1024;
+
 async function main() {
   const region = process.env.AWS_DEFAULT_REGION ?? "us-east-1";
   const useS3Polling = process.env.S3_POLLING_ENABLED === "true";
@@ -63,8 +71,22 @@ async function main() {
     output = await pollSensor({ sqs, s3, logger });
   }
 
-  // Output clean JSON to stdout (Python reads this)
-  console.log(JSON.stringify(output));
+  // Output clean JSON to stdout (Python reads this). Large batches go
+  // through /dev/shm with an @file: marker on stdout instead.
+  const payload = JSON.stringify(output);
+
+  if (payload.length > SHM_THRESHOLD_BYTES && existsSync(SHM_DIR)) {
+    const shmPath = `${SHM_DIR}/dagster-sensor-${process.pid}-${Date.now()}.json`;
+    try {
+      writeFileSync(shmPath, payload);
+      console.log(`@file:${shmPath}`);
+      return;
+    } catch {
+      // /dev/shm not writable — fall back to the pipe
+    }
+  }
+
+  console.log(payload);
 }
 
 main().catch((err) => {
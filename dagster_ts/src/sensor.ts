@@ -143,6 +143,7 @@ export async function pollSensor(options: SensorOptions): Promise<SensorOutput>
             s3Bucket: record.bucket,
             s3Key: record.key,
             taskSize,
+            s3Etag: record.etag,
           },
           tags: {
             s3_bucket: record.bucket,